@@ -1,4 +1,5 @@
 # src/config.py
+from functools import lru_cache
 from pathlib import Path
 import os
 from dotenv import load_dotenv
@@ -10,9 +11,15 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 load_dotenv(ROOT_DIR / ".env")
 
 # 3. Paths (from .env variables)
-DATA_RAW_DIR = ROOT_DIR / os.getenv("RAW_PATH", "data/raw")
-DATA_PROCESSED_DIR = ROOT_DIR / os.getenv("PROCESSED_PATH", "data/processed")
-NOTEBOOKS_DIR = ROOT_DIR / os.getenv("NOTEBOOKS_PATH", "notebooks")
-REPORTS_DIR = ROOT_DIR / os.getenv("REPORTS_PATH", "reports")
-FIGURES_DIR = ROOT_DIR / os.getenv("FIGURES_PATH", "reports/figures")
-MISC_DIR = ROOT_DIR / os.getenv("MISC", "misc")
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_path(env_var: str, default_value: str) -> Path:
+    "Returns the path set in env_var (or default_value), resolved against the project root if relative"
+    path_obj = Path(os.getenv(env_var, default_value))
+    return path_obj if path_obj.is_absolute() else ROOT_DIR / path_obj
+
+DATA_RAW_DIR = get_path("RAW_PATH", "data/raw")
+DATA_PROCESSED_DIR = get_path("PROCESSED_PATH", "data/processed")
+NOTEBOOKS_DIR = get_path("NOTEBOOKS_PATH", "notebooks")
+REPORTS_DIR = get_path("REPORTS_PATH", "reports")
+FIGURES_DIR = get_path("FIGURES_PATH", "reports/figures")
+MISC_DIR = get_path("MISC", "misc")
\ No newline at end of file
@@ -1,7 +1,13 @@
 # src/helpers_io.py
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Union
+from typing import Iterator, Union
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from .config import DATA_RAW_DIR, DATA_PROCESSED_DIR
 
@@ -17,6 +23,10 @@ def processed_path(filename: str) -> Path:
     return DATA_PROCESSED_DIR / filename
 
 # Reading CSVs from 'raw' and 'processed' folders
+# Pass engine="pyarrow" to opt into the multithreaded Arrow parser. It is not the default because it behaves differently:
+# - ISO date columns come back as datetime.date objects when parse_dates is not passed
+# - index_col=..., parse_dates=True leaves an object Index of datetime.date (no DatetimeIndex, so no .loc["2020"]/.resample)
+# - Options such as nrows, low_memory, skipfooter or callable skiprows raise a ValueError
 def read_csv_raw(filename: str, **kwargs) -> pd.DataFrame:
     "Reads a CSV file from data/raw"
     return pd.read_csv(raw_path(filename), **kwargs)
@@ -25,9 +35,48 @@ def read_csv_processed(filename: str, **kwargs) -> pd.DataFrame:
     "Reads a CSV file from data/processed"
     return pd.read_csv(processed_path(filename), **kwargs)
 
+# Reading Parquet files from 'raw' and 'processed' folders
+def read_parquet_raw(filename: str, **kwargs) -> pd.DataFrame:
+    "Reads a Parquet file from data/raw"
+    kwargs.setdefault("engine", "pyarrow")
+    return pd.read_parquet(raw_path(filename), **kwargs)
+
+def read_parquet_processed(filename: str, **kwargs) -> pd.DataFrame:
+    "Reads a Parquet file from data/processed"
+    kwargs.setdefault("engine", "pyarrow")
+    return pd.read_parquet(processed_path(filename), **kwargs)
+
+# Atomic writes: the file is written under its own name inside a hidden temporary folder next to the target,
+# then moved into place, so readers never see a partial file and pandas still infers compression/archive names
+@contextmanager
+def _atomic_path(filepath: Path) -> Iterator[Path]:
+    "Yields a temporary path with the same file name as filepath, moved onto filepath if no error is raised"
+    tmp_dir = Path(tempfile.mkdtemp(prefix=".tmp-", dir=filepath.parent))
+    try:
+        tmp_path = tmp_dir / filepath.name
+        yield tmp_path
+        os.replace(tmp_path, filepath)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+# Saving CSV atomically
+def save_csv_atomic(df: pd.DataFrame, filepath: PathLike, **kwargs) -> None:
+    "Saves a DataFrame as CSV through a temporary file renamed into place"
+    filepath = Path(filepath)
+    with _atomic_path(filepath) as tmp_path:
+        df.to_csv(tmp_path, **kwargs)
+
+# Saving Parquet atomically (written straight through pyarrow's C++ writer)
+def save_parquet_atomic(df: pd.DataFrame, filepath: PathLike, index: bool = False, **kwargs) -> None:
+    "Saves a DataFrame as Parquet through a temporary file renamed into place"
+    filepath = Path(filepath)
+    table = pa.Table.from_pandas(df, preserve_index=index)
+    with _atomic_path(filepath) as tmp_path:
+        pq.write_table(table, tmp_path, **kwargs)
+
 # Saving CSV in 'processed' folder
 def save_csv_processed(df: pd.DataFrame, filename: str, index: bool = False, **kwargs) -> None:
     "Saves a DataFrame in data/processed"
     filepath = processed_path(filename)
     filepath.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(filepath, index=index, **kwargs)
\ No newline at end of file
+    save_csv_atomic(df, filepath, index=index, **kwargs)
\ No newline at end of file